@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import abc
 from typing import Generic, TypeVar, NamedTuple, Sequence, Union, Mapping, Iterable, Dict, \
-    Iterator, Any, Type, Optional, Callable
+    Iterator, Any, Type, Optional, Callable, List
 
 import networkx
 
@@ -166,6 +166,11 @@ class Archive(Generic[IdT], metaclass=abc.ABCMeta):
     def load(self, snapshot_id: SnapshotId) -> DataRecord:
         """Load a snapshot of an object with the given reference"""
 
+    @abc.abstractmethod
+    def load_many(self, snapshot_ids: Sequence[SnapshotId]) -> List[DataRecord]:
+        """Load the snapshot records for the given snapshot ids.  The records are returned in the
+        same order as the ids"""
+
     @abc.abstractmethod
     def history(self, obj_id: IdT, idx_or_slice) -> [DataRecord, Sequence[DataRecord]]:
         """Load the snapshot records for a particular object, can return a single or multiple
@@ -298,10 +303,17 @@ class BaseArchive(Archive[IdT]):
         for entry in metas.items():
             self.meta_set(*entry)
 
+    def load_many(self, snapshot_ids: 'Sequence[Archive.SnapshotId]') -> List[DataRecord]:
+        """
+        This will load records one by one but subclasses may want to override this behaviour if
+        they can load multiple records at once.
+        """
+        return [self.load(snapshot_id) for snapshot_id in snapshot_ids]
+
     def history(self, obj_id: IdT, idx_or_slice) -> [DataRecord, Sequence[DataRecord]]:
         refs = self.get_snapshot_ids(obj_id)[idx_or_slice]
         if len(refs) > 1:
-            return [self.load(ref) for ref in refs]
+            return self.load_many(refs)
 
         # Single one
         return self.load(refs[0])
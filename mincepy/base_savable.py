@@ -25,28 +25,9 @@ class BaseSavableObject(types.SavableObject):
     ATTRS = tuple()
     IGNORE_MISSING = True  # When loading ignore attributes that are missing in the record
 
-    def __new__(cls, *_args, **_kwargs):
-        new_instance = super(BaseSavableObject, cls).__new__(cls)
-        attrs = {}
-        for entry in cls.mro():
-            try:
-                class_attrs = getattr(entry, 'ATTRS')
-            except AttributeError:
-                pass
-            else:
-                for attr_spec in class_attrs:
-                    if isinstance(attr_spec, str):
-                        # If it's just a string then default to store by value
-                        attr_spec = AttrSpec(attr_spec, False)
-
-                    # Check that it's not already there so higher up in the MRO is always kept
-                    if attr_spec.name not in attrs:
-                        attrs[attr_spec.name] = attr_spec
-
-        setattr(new_instance, '__attrs', attrs.values())
-        return new_instance
-
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
 
@@ -87,7 +68,36 @@ class BaseSavableObject(types.SavableObject):
                 setattr(self, attr.name, obj)
 
     def __get_attrs(self) -> typing.Sequence[AttrSpec]:
-        return getattr(self, '__attrs')
+        obj_type = type(self)
+        # The specs only depend on the type so store them on the class when first needed.  Look in
+        # the class __dict__ directly so that a subclass never picks up its parent's specs.
+        try:
+            return obj_type.__dict__['__attr_specs']
+        except KeyError:
+            attr_specs = _get_attr_specs(obj_type)
+            setattr(obj_type, '__attr_specs', attr_specs)
+            return attr_specs
+
+
+def _get_attr_specs(obj_type: type) -> typing.Tuple[AttrSpec, ...]:
+    """Get the attribute specifications of a type by gathering the ATTRS from its MRO"""
+    attrs = {}
+    for entry in obj_type.mro():
+        try:
+            class_attrs = getattr(entry, 'ATTRS')
+        except AttributeError:
+            pass
+        else:
+            for attr_spec in class_attrs:
+                if isinstance(attr_spec, str):
+                    # If it's just a string then default to store by value
+                    attr_spec = AttrSpec(attr_spec, False)
+
+                # Check that it's not already there so higher up in the MRO is always kept
+                if attr_spec.name not in attrs:
+                    attrs[attr_spec.name] = attr_spec
+
+    return tuple(attrs.values())
 
 
 class ConvenienceMixin:
@@ -39,12 +39,23 @@ REF = 'ref'
 def print_records(records: typing.Sequence[mincepy.records.DataRecord], historian):
     columns = OrderedDict()
     refs = []
+    # Type id -> type name.  There are typically only a handful of distinct types so look each up
+    # just once.  None means that the type is not known to the historian.
+    type_names = {}
     for record in records:
         try:
-            helper = historian.get_helper(record.type_id)
-            type_str = get_type_name(helper.TYPE) + f'#{record.version}'
+            type_name = type_names[record.type_id]
         except KeyError:
+            try:
+                type_name = get_type_name(historian.get_helper(record.type_id).TYPE)
+            except KeyError:
+                type_name = None
+            type_names[record.type_id] = type_name
+
+        if type_name is None:
             type_str = str(record.snapshot_id)
+        else:
+            type_str = f'{type_name}#{record.version}'
         if record.is_deleted_record():
             type_str += ' [deleted]'
         refs.append(type_str)
@@ -83,7 +83,7 @@ class RealEquator(SimpleHelper):
     TYPE = numbers.Real
 
     def yield_hashables(self, obj, hasher):
-        yield from hasher.yield_hashables(hasher.float_to_str(obj))
+        yield hasher.float_to_str(obj).encode('utf-8')
 
 
 class ComplexEquator(SimpleHelper):
@@ -98,7 +98,7 @@ class IntegerEquator(SimpleHelper):
     TYPE = numbers.Integral
 
     def yield_hashables(self, obj: numbers.Integral, hasher):
-        yield from hasher.yield_hashables(f'{obj}')
+        yield f'{obj}'.encode('utf-8')
 
 
 class BoolEquator(SimpleHelper):
@@ -112,7 +112,7 @@ class NoneEquator(SimpleHelper):
     TYPE = type(None)
 
     def yield_hashables(self, obj, hasher):
-        yield from hasher.yield_hashables('None')
+        yield b'None'
 
 
 class TupleEquator(SimpleHelper):
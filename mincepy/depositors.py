@@ -72,8 +72,12 @@ class Saver(Base, metaclass=ABCMeta):
         historian = self.get_historian()
 
         if historian.is_primitive(obj):
-            # Deal with the special containers by encoding their values if need be
-            return tree.transform(self.encode, obj, path, schema=schema)
+            if isinstance(obj, CONTAINERS):
+                # Deal with the special containers by encoding their values if need be
+                return tree.transform(self.encode, obj, path, schema=schema)
+
+            # Nothing more to do for the rest
+            return obj
 
         # Store by value
         helper = historian.get_helper(type(obj), auto_register=True)
@@ -117,9 +121,9 @@ class Loader(Base, metaclass=ABCMeta):
                updates=None):
         """Given the encoded state and an optional schema that defines the type of the encoded
         objects this method will decode the saved state and load the object."""
-        try:
-            entry = schema[path]
-        except KeyError:
+        # Most entries in a state have no schema entry so look it up without raising for these
+        entry = schema.get(path)
+        if entry is None:
             # There is no schema entry so this is a primitive type and only containers need to (potentially)
             # decoded further
             if isinstance(encoded, CONTAINERS):
@@ -127,33 +131,32 @@ class Loader(Base, metaclass=ABCMeta):
 
             # Fully decoded
             return encoded
-        else:
-            saved_state = encoded
-            helper = self.get_historian().get_helper(entry.type_id)
-            if helper.IMMUTABLE:
-                saved_state = self._recursive_unpack(encoded, schema, path, created_callback)
-
-            new_obj = helper.new(saved_state)
-            if new_obj is None:
-                raise RuntimeError("Helper '{}' failed to create a class given state '{}'".format(
-                    helper.__class__, saved_state))
-
-            if created_callback is not None:
-                created_callback(path, new_obj)
-
-            if not helper.IMMUTABLE:
-                saved_state = self._recursive_unpack(encoded, schema, path, created_callback,
-                                                     updates)
-
-            updated = helper.ensure_up_to_date(saved_state, entry.version, self)
-            if updated is not None:
-                # Use the current version of the record
-                saved_state = updated
-                if updates is not None:
-                    updates[path] = updated
-
-            helper.load_instance_state(new_obj, saved_state, self)
-            return new_obj
+
+        saved_state = encoded
+        helper = self.get_historian().get_helper(entry.type_id)
+        if helper.IMMUTABLE:
+            saved_state = self._recursive_unpack(encoded, schema, path, created_callback)
+
+        new_obj = helper.new(saved_state)
+        if new_obj is None:
+            raise RuntimeError("Helper '{}' failed to create a class given state '{}'".format(
+                helper.__class__, saved_state))
+
+        if created_callback is not None:
+            created_callback(path, new_obj)
+
+        if not helper.IMMUTABLE:
+            saved_state = self._recursive_unpack(encoded, schema, path, created_callback, updates)
+
+        updated = helper.ensure_up_to_date(saved_state, entry.version, self)
+        if updated is not None:
+            # Use the current version of the record
+            saved_state = updated
+            if updates is not None:
+                updates[path] = updated
+
+        helper.load_instance_state(new_obj, saved_state, self)
+        return new_obj
 
     def _recursive_unpack(self,
                           encoded_saved_state,
@@ -287,14 +290,12 @@ class LiveDepositor(Saver, Loader):
 
             with self._cycle_protection(obj):
                 # Ok, have to save it
-                current_hash = historian.hash(obj)
-
                 try:
                     # Let's see if we have a record at all
                     record = historian._live_objects.get_record(obj)  # pylint: disable=protected-access
                 except exceptions.NotFound:
                     # Object being saved for the first time
-                    builder = self._create_builder(helper, snapshot_hash=current_hash)
+                    builder = self._create_builder(helper, snapshot_hash=historian.hash(obj))
                     record = self._save_from_builder(obj, builder)
                     if historian.meta.sticky:
                         # Apply the sticky meta
@@ -306,11 +307,12 @@ class LiveDepositor(Saver, Loader):
                                     record.obj_id)
                         return record
 
-                    # Check if our record is up-to-date
+                    # Check if our record is up-to-date.  Only hash now that we know it's needed
+                    # and only load the saved version if the hashes suggest nothing has changed.
+                    current_hash = historian.hash(obj)
                     with historian.transaction() as nested:
-                        loaded_obj = SnapshotLoader(historian).load_from_record(record)
-
-                        if current_hash == record.snapshot_hash and historian.eq(obj, loaded_obj):
+                        if current_hash == record.snapshot_hash and \
+                                historian.eq(obj, SnapshotLoader(historian).load_from_record(record)):
                             # Objects identical
                             nested.rollback()
                         else:
@@ -2,13 +2,16 @@
 """Query expressions"""
 import abc
 import copy
-from typing import Union, List, Iterable
+from typing import Union, List, Iterable, Dict, Type
 
 __all__ = ('Expr', 'WithListOperand', 'Empty', 'Operator', 'Eq', 'Gt', 'Gte', 'In', 'Lt', 'Lte',
            'Ne', 'Nin', 'Comparison', 'Logical', 'And', 'Not', 'Or', 'Nor', 'Exists', 'Queryable',
            'WithQueryContext', 'query_expr', 'field_name', 'build_expr', 'Query')
 
 import bson.regex
+import deprecation
+
+from . import version
 
 
 class FilterLike(metaclass=abc.ABCMeta):
@@ -36,12 +39,14 @@ class Expr(FilterLike, metaclass=abc.ABCMeta):
     def __and__(self, other: 'Expr') -> 'And':
         if not isinstance(other, Expr):
             raise TypeError(f"Expected Expr got '{other}'")
-        return And([self, other])
+        # Economise on Ands and fuse them here so that chains stay flat
+        return And([*_fuse_operands(self, And), *_fuse_operands(other, And)])
 
     def __or__(self, other: 'Expr') -> 'Or':
         if not isinstance(other, Expr):
             raise TypeError(f"Expected Expr got '{other}'")
-        return Or([self, other])
+        # Economise on Ors and fuse them here so that chains stay flat
+        return Or([*_fuse_operands(self, Or), *_fuse_operands(other, Or)])
 
 
 class WithListOperand(FilterLike):
@@ -58,10 +63,12 @@ class WithListOperand(FilterLike):
         self.operand = operand
 
     def __query_expr__(self) -> dict:
+        # The operands are known to be Exprs (see constructor) so we can skip the checks in
+        # query_expr() and ask them for their query directly
         if len(self.operand) == 1:
-            return query_expr(self.operand[0])
+            return self.operand[0].__query_expr__()
 
-        return {self.oper: list(map(query_expr, self.operand))}
+        return {self.oper: [entry.__query_expr__() for entry in self.operand]}
 
 
 class Empty(Expr):
@@ -78,6 +85,10 @@ class Operator(Expr):  # pylint: disable=abstract-method
     """Interface for operators"""
 
 
+# Operator string -> simple operator type, populated as the operators are defined
+COMPARISON_OPERATORS = {}  # type: Dict[str, Type[SimpleOperator]]
+
+
 class SimpleOperator(Operator):
     """A simple operator expression.
 
@@ -87,6 +98,11 @@ class SimpleOperator(Operator):
     __slots__ = ('value',)
     oper = None  # type: str
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.oper is not None:
+            COMPARISON_OPERATORS[cls.oper] = cls
+
     def __init__(self, value):
         self.value = value
 
@@ -134,9 +150,6 @@ class Nin(SimpleOperator):
     oper = '$nin'
 
 
-COMPARISON_OPERATORS = {oper_type.oper: oper_type for oper_type in SimpleOperator.__subclasses__()}
-
-
 class Comparison(Expr):
     """A comparison expression consists of a field and an operator expression e.g. name == 'frank'
     where name is the field, the operator is ==, and the value is 'frank'
@@ -157,7 +170,7 @@ class Comparison(Expr):
             # Special case for this query as it looks nicer this way (without using '$eq')
             return {field_name(self.field): self.expr.value}
 
-        return {field_name(self.field): query_expr(self.expr)}
+        return {field_name(self.field): self.expr.__query_expr__()}
 
 
 # endregion
@@ -178,20 +191,13 @@ class Logical(Expr):
         self.operand = operand
 
     def __query_expr__(self) -> dict:
-        return {self.oper: query_expr(self.operand)}
+        return {self.oper: self.operand.__query_expr__()}
 
 
 class And(WithListOperand, Logical):
     __slots__ = ()
     oper = '$and'
 
-    def __and__(self, other: 'Expr') -> 'And':
-        if isinstance(other, And):
-            # Economise on Ands and fuse them here
-            return And([*self.operand, *other.operand])
-
-        return super().__and__(other)
-
 
 class Not(Logical):
     __slots__ = ()
@@ -202,19 +208,21 @@ class Or(WithListOperand, Logical):
     __slots__ = ()
     oper = '$or'
 
-    def __or__(self, other: 'Expr') -> 'Or':
-        if isinstance(other, Or):
-            # Economise on Ors and fuse them here
-            return Or([*self.operand, *other.operand])
-
-        return super().__or__(other)
-
 
 class Nor(WithListOperand, Logical):
     __slots__ = ()
     oper = '$nor'
 
 
+def _fuse_operands(expression: Expr, logical_type: type) -> Iterable[Expr]:
+    """Get the operands that should be used in place of the passed expression when combining it
+    using an associative logical operator.  If the expression is itself of that logical type its
+    operands can be taken directly, avoiding a nested expression."""
+    if isinstance(expression, logical_type):
+        return expression.operand
+    return (expression,)
+
+
 # endregion
 
 # region Element operators
@@ -304,11 +312,18 @@ class WithQueryContext:
     """A mixin for Queryable objects that allows a context to be added which is always 'anded' with
     the resulting query condition for any operator"""
     _query_context = None
+    _context_operands = ()  # The expressions to 'and' with each query condition
 
     # pylint: disable=no-member
 
     def set_query_context(self, expr: Expr):
         self._query_context = expr
+        # Work out the operands once here rather than every time a condition is combined.  An empty
+        # context doesn't restrict anything so there is nothing to 'and' with.
+        if expr is None or isinstance(expr, Empty):
+            self._context_operands = ()
+        else:
+            self._context_operands = tuple(_fuse_operands(expr, And))
 
     def __eq__(self, other) -> Expr:
         return self._combine(super().__eq__(other))
@@ -338,9 +353,9 @@ class WithQueryContext:
         return self._combine(super().exists_(value))
 
     def _combine(self, expr: Expr) -> Expr:
-        if self._query_context is None:
+        if not self._context_operands:
             return expr
-        return And([self._query_context, expr])
+        return And([*self._context_operands, expr])
 
 
 def query_expr(filter: FilterLike) -> dict:  # pylint: disable=redefined-builtin
@@ -352,11 +367,10 @@ def query_expr(filter: FilterLike) -> dict:  # pylint: disable=redefined-builtin
     if isinstance(filter, dict):
         return filter
 
-    # Work from the object's type to match method resolution of other magic methods.
-    try:
-        query_repr = filter.__query_expr__()
-    except AttributeError:
-        raise TypeError('expected dict or object with __query_expr__, not ' + str(filter)) from None
+    getter = getattr(filter, '__query_expr__', None)
+    if getter is None:
+        raise TypeError('expected dict or object with __query_expr__, not ' + str(filter))
+    query_repr = getter()
 
     if isinstance(query_repr, dict):
         return query_repr
@@ -370,10 +384,10 @@ def field_name(field) -> str:
     if isinstance(field, str):
         return field
 
-    try:
-        name = field.__field_name__()
-    except AttributeError:
-        raise TypeError('expected str or object with __field__name__, not ' + str(field)) from None
+    getter = getattr(field, '__field_name__', None)
+    if getter is None:
+        raise TypeError('expected str or object with __field__name__, not ' + str(field))
+    name = getter()
 
     if isinstance(name, str):
         return name
@@ -406,12 +420,9 @@ def build_expr(item) -> Expr:
 
         first, second = item
         if first.startswith('$'):
-            # Comparison operators
-            try:
-                oper = COMPARISON_OPERATORS[first]
-            except KeyError:
-                pass
-            else:
+            # Comparison and element operators
+            oper = COMPARISON_OPERATORS.get(first)
+            if oper is not None:
                 return oper(second)
 
             # Logical operators
@@ -423,9 +434,6 @@ def build_expr(item) -> Expr:
                 return Nor(list(map(build_expr, second)))
             if first == '$or':
                 return Or(list(map(build_expr, second)))
-            # Element query
-            if first == '$exists':
-                return Exists(second)
 
             raise ValueError(f"Unknown operator '{item}'")
 
@@ -438,11 +446,10 @@ def build_expr(item) -> Expr:
             # Assume second is a value type
             return Comparison(first, Eq(second))
 
-    try:
-        return item.__expr__()
-    except AttributeError:
-        raise TypeError('expected dict or object with __expr__, not ' +
-                        type(item).__name__) from None
+    getter = getattr(item, '__expr__', None)
+    if getter is None:
+        raise TypeError('expected dict or object with __expr__, not ' + type(item).__name__)
+    return getter()
 
 
 class Query:
@@ -456,7 +463,7 @@ class Query:
         self.skip = skip
 
     def __str__(self) -> str:
-        return str(self.__dict__)
+        return str(self.to_dict())
 
     def copy(self) -> 'Query':
         return Query(*copy.copy(self._filter_expressions),
@@ -464,9 +471,17 @@ class Query:
                      sort=self.sort,
                      skip=self.skip)
 
+    def to_dict(self) -> dict:
+        """Get the query as a dictionary of the filter, sort, limit and skip"""
+        return dict(filter=self.get_filter(), sort=self.sort, limit=self.limit, skip=self.skip)
+
     @property
+    @deprecation.deprecated(deprecated_in='0.15.26',
+                            removed_in='0.17.0',
+                            current_version=version.__version__,
+                            details='Use Query.to_dict() instead')
     def __dict__(self) -> dict:
-        return dict(filter=self.get_filter(), sort=self.sort, limit=self.limit, skip=self.skip)
+        return self.to_dict()
 
     def append(self, expr: Expr):
         self._filter_expressions.append(build_expr(expr))
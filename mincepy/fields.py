@@ -79,6 +79,7 @@ class Field(expr.WithQueryContext, expr.Queryable, property):
         """
         super().__init__()
         self._properties = properties
+        self._path = None  # The cached path, see get_path()
         self.path_prefix = path_prefix
 
     def __getattribute__(self, item: str):
@@ -110,6 +111,15 @@ class Field(expr.WithQueryContext, expr.Queryable, property):
     def __field_name__(self) -> str:
         return self._properties.store_as
 
+    @property
+    def path_prefix(self) -> str:
+        return self._path_prefix
+
+    @path_prefix.setter
+    def path_prefix(self, prefix: str):
+        self._path_prefix = prefix
+        self._path = None
+
     def __call__(self, fget=None, fset=None, fdel=None, doc=None, prop_kwargs=None) -> property:
         """This method allows the field to become a property"""
         self.getter(fget)
@@ -164,10 +174,15 @@ class Field(expr.WithQueryContext, expr.Queryable, property):
         del obj.__dict__[self._properties.attr_name]
 
     def get_path(self) -> str:
-        if self.path_prefix:
-            return self.path_prefix + '.' + self._properties.store_as
-
-        return self._properties.store_as
+        path = self._path
+        if path is None:
+            store_as = self._properties.store_as
+            path = self._path_prefix + '.' + store_as if self._path_prefix else store_as
+            # Only cache once the name is known, it may not be until the owning class is created
+            if store_as is not None:
+                self._path = path
+
+        return path
 
 
 def field(
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import os
 import pathlib
 import shutil
 import tempfile
@@ -15,7 +16,7 @@ class File(base_savable.SimpleSavable):
     """A mincePy file object.  These should not be instantiated directly but using Historian.create_file()"""
 
     TYPE_ID = type_ids.FILE_TYPE_ID
-    READ_SIZE = 256  # The number of bytes to read at a time
+    READ_SIZE = 1 << 20  # The number of bytes to read at a time (1 MiB)
 
     def __init__(self, file_store, filename: str = None, encoding=None):
         super().__init__()
@@ -116,22 +117,16 @@ class File(base_savable.SimpleSavable):
             return False
 
         try:
-            with self.open() as my_file:
+            with self.open('rb') as my_file:
                 try:
-                    with other.open() as other_file:
-                        while True:
-                            my_line = my_file.readline(self.READ_SIZE)
-                            other_line = other_file.readline(self.READ_SIZE)
-                            if my_line != other_line:
-                                return False
-                            if my_line == '' and other_line == '':
-                                return True
+                    with other.open('rb') as other_file:
+                        return _streams_equal(my_file, other_file, self.READ_SIZE)
                 except FileNotFoundError:
                     return False
         except FileNotFoundError:
             # Our file doesn't exist, make sure the other doesn't either
             try:
-                with other.open():
+                with other.open('rb'):
                     return False
             except FileNotFoundError:
                 return True
@@ -141,14 +136,32 @@ class File(base_savable.SimpleSavable):
         try:
             with self.open('rb') as opened:
                 while True:
-                    line = opened.read(self.READ_SIZE)
-                    if line == b'':
+                    block = opened.read(self.READ_SIZE)
+                    if not block:
                         return
-                    yield line
+                    yield block
         except FileNotFoundError:
             yield from hasher.yield_hashables(None)
 
 
+def _streams_equal(stream1: BinaryIO, stream2: BinaryIO, read_size: int) -> bool:
+    """Compare the contents of two binary file streams.  Streams of differing size are rejected
+    straight away, otherwise blocks are read into two reusable buffers and compared in place."""
+    size = os.fstat(stream1.fileno()).st_size
+    if size != os.fstat(stream2.fileno()).st_size:
+        return False
+
+    buffer1 = bytearray(min(read_size, size))
+    buffer2 = bytearray(len(buffer1))
+    view1, view2 = memoryview(buffer1), memoryview(buffer2)
+    while True:
+        num_read = stream1.readinto(buffer1)
+        if num_read != stream2.readinto(buffer2) or view1[:num_read] != view2[:num_read]:
+            return False
+        if not num_read:
+            return True
+
+
 def _create_buffer_file():
     tmp_file = tempfile.NamedTemporaryFile(delete=False)
     tmp_path = tmp_file.name
@@ -40,7 +40,7 @@ class ResultSet(Generic[T]):
         self._entry_factory = entry_factory or (lambda x: x)
 
     def __iter__(self) -> Iterable[T]:
-        for entry in self._archive_collection.find(**self._query.__dict__, **self._kwargs):
+        for entry in self._archive_collection.find(**self._query.to_dict(), **self._kwargs):
             yield self._entry_factory(entry)
 
     def __len__(self) -> int:
@@ -76,8 +76,11 @@ class ResultSet(Generic[T]):
         query.limit = 1
         query.sort = None
 
-        results = tuple(self._archive_collection.find(**query.__dict__, **self._kwargs))
-        return self._entry_factory(results[0])
+        # Just take the first result from the cursor (if there is one)
+        for entry in self._archive_collection.find(**query.to_dict(), **self._kwargs):
+            return self._entry_factory(entry)
+
+        return None
 
     def one(self) -> Optional[T]:
         """Return one item from a result set containing at most one item.
@@ -89,7 +92,7 @@ class ResultSet(Generic[T]):
         query = self._query.copy()
         if query.limit is not None and query.limit > 2:
             query.limit = 2
-        results = tuple(self._archive_collection.find(**query.__dict__, **self._kwargs))
+        results = tuple(self._archive_collection.find(**query.to_dict(), **self._kwargs))
         if not results:
             return None
 
@@ -105,7 +108,7 @@ class ResultSet(Generic[T]):
     def _project(self, *field: str) -> Iterator:
         """Get raw fields from the record dictionary"""
         projection = {name: 1 for name in field}
-        for entry in self._archive_collection.find(**self._query.__dict__,
+        for entry in self._archive_collection.find(**self._query.to_dict(),
                                                    projection=projection,
                                                    **self._kwargs):
             yield entry
@@ -10,7 +10,7 @@ except ImportError:
 import getpass
 import logging
 import socket
-from typing import MutableMapping, Any, Optional, Iterable, Union, Iterator, Type, Dict, Callable, Sequence
+from typing import MutableMapping, Any, Optional, Iterable, Union, Iterator, Type, Dict, Callable, Sequence, List
 import weakref
 
 import deprecation
@@ -87,6 +87,9 @@ class Historian:  # pylint: disable=too-many-public-methods, too-many-instance-a
 
     def __init__(self, archive: archives.Archive, equators=()):
         self._archive = archive
+        # The primitives are fixed once we have the archive, keep a set as well for fast lookups
+        self._primitives = types.PRIMITIVE_TYPES + (archive.get_id_type(),)
+        self._primitives_set = frozenset(self._primitives)
         self._equator = types.Equator(defaults.get_default_equators() + equators)
         # Register default types
         self._type_registry = type_registry.TypeRegistry()
@@ -125,7 +128,7 @@ class Historian:  # pylint: disable=too-many-public-methods, too-many-instance-a
     @property
     def primitives(self) -> tuple:
         """A tuple of all the primitive types"""
-        return types.PRIMITIVE_TYPES + (self._archive.get_id_type(),)
+        return self._primitives
 
     @property
     def migrations(self) -> migrate.Migrations:
@@ -242,11 +245,42 @@ class Historian:  # pylint: disable=too-many-public-methods, too-many-instance-a
     def load_snapshot_from_record(self, record: recordsm.DataRecord) -> object:
         return self._new_snapshot_depositor().load_from_record(record)
 
+    def _load_snapshots(self, snapshot_ids: Sequence[recordsm.SnapshotId]) -> List[object]:
+        """Load several snapshots, fetching their records from the archive in one go.  As with
+        load_snapshot(), each snapshot is loaded by its own depositor so no objects are shared
+        between them."""
+        return [
+            None if record.is_deleted_record() else self.load_snapshot_from_record(record)
+            for record in self._archive.load_many(snapshot_ids)
+        ]
+
     def load(self, *obj_id_or_snapshot_id):
         """Load object(s) or snapshot(s)."""
+        snapshot_idxs = []
+        obj_idxs = []
+        for idx, entry in enumerate(obj_id_or_snapshot_id):
+            if isinstance(entry, recordsm.SnapshotId):
+                snapshot_idxs.append(idx)
+            else:
+                obj_idxs.append(idx)
+
+        # When loading several at once, fetch the records from the archive together rather than
+        # one at a time.  Anything not preloaded here (e.g. because it can't be found) is left to
+        # load_one() which will take care of raising the appropriate exception.
+        preloaded = {}  # index -> loaded object or snapshot
+        if len(snapshot_idxs) > 1:
+            snapshots = self._load_snapshots([obj_id_or_snapshot_id[idx] for idx in snapshot_idxs])
+            preloaded.update(zip(snapshot_idxs, snapshots))
+        if len(obj_idxs) > 1:
+            objects = self._load_objects([obj_id_or_snapshot_id[idx] for idx in obj_idxs])
+            preloaded.update((obj_idxs[pos], obj) for pos, obj in objects.items())
+
         loaded = []
-        for entry in obj_id_or_snapshot_id:
-            loaded.append(self.load_one(entry))
+        for idx, entry in enumerate(obj_id_or_snapshot_id):
+            try:
+                loaded.append(preloaded[idx])
+            except KeyError:
+                loaded.append(self.load_one(entry))
 
         if len(obj_id_or_snapshot_id) == 1:
             return loaded[0]
@@ -380,9 +414,10 @@ class Historian:  # pylint: disable=too-many-public-methods, too-many-instance-a
         indices = utils.to_slice(idx_or_slice)
         to_get = snapshot_ids[indices]
         if as_objects:
-            return [ObjectEntry(sid, self.load(sid)) for sid in to_get]
+            snapshots = self._load_snapshots(to_get)
+            return [ObjectEntry(sid, snapshot) for sid, snapshot in zip(to_get, snapshots)]
 
-        return [self._archive.load(ref) for ref in to_get]
+        return self._archive.load_many(to_get)
 
     def get_current_record(self, obj: object) -> recordsm.DataRecord:
         """Get the current record that the historian has cached for the passed object"""
@@ -509,7 +544,7 @@ class Historian:  # pylint: disable=too-many-public-methods, too-many-instance-a
     def is_primitive(self, obj) -> bool:
         """Check if the object is one of the primitives and should be saved by value in the
         archive"""
-        return obj.__class__ in self.primitives
+        return obj.__class__ in self._primitives_set
 
     def is_obj_id(self, obj_id) -> bool:
         """Check if an object is of the object id type"""
@@ -668,20 +703,18 @@ class Historian:  # pylint: disable=too-many-public-methods, too-many-instance-a
 
         result = result_types.MergeResult()
         # get the outgoing snapshot ref. graph
+        batch = []
         while remote_snapshot_ids:
-            # Get a batch
-            batch = set()
-            try:
-                for _ in range(batch_size):
-                    batch.add(remote_snapshot_ids.pop())
-            except KeyError:
-                pass
+            # Get a batch, reusing the same list each time
+            batch.clear()
+            for _ in range(min(batch_size, len(remote_snapshot_ids))):
+                batch.append(remote_snapshot_ids.pop())
             graph = remote.references.get_snapshot_ref_graph(*batch)
 
             # The graph may contain nodes that are still in our list of remote snapshots to transfer
-            # so check and remove these because they will be done in this batch
-            extras = set(graph.nodes) - batch
-            remote_snapshot_ids.difference_update(extras)
+            # so remove these because they will be done in this batch.  The batch itself has already
+            # been popped so there is no need to build a set of just the extras.
+            remote_snapshot_ids.difference_update(graph.nodes)
 
             partial_result = self._merge_batch(remote, graph)
             result.update(partial_result)
@@ -910,6 +943,29 @@ class Historian:  # pylint: disable=too-many-public-methods, too-many-instance-a
             # Ok, just use the one from the archive
             return depositor.load_from_record(record)
 
+    def _load_objects(self, obj_ids: Sequence) -> dict:
+        """Load multiple objects getting the records of those that aren't live from the archive in
+        one go.  Returns a dictionary mapping the position of each id that could be loaded to the
+        object."""
+        loaded = {}
+        to_fetch = {}  # obj id -> positions of the ids that refer to it
+        for pos, entry in enumerate(obj_ids):
+            obj_id = self._ensure_obj_id(entry)
+            try:
+                loaded[pos] = self.get_obj(obj_id)
+            except exceptions.ObjectDeleted:
+                pass
+            except exceptions.NotFound:
+                to_fetch.setdefault(obj_id, []).append(pos)
+
+        if to_fetch:
+            for record in self._objects.records.find(recordsm.DataRecord.obj_id.in_(*to_fetch)):
+                obj = self._load_object_from_record(record)
+                for pos in to_fetch[record.obj_id]:
+                    loaded[pos] = obj
+
+        return loaded
+
     def _ensure_obj_id(self, obj_or_identifier):
         """
         This call will try and get an object id from the passed parameter.  Uses .to_obj_id() and raises NotFound if it
@@ -3,7 +3,6 @@
 archive and methods to convert mincepy types to mongo collection entries and back"""
 import functools
 
-from bidict import bidict
 import bson
 
 import mincepy.records
@@ -25,7 +24,7 @@ REFERENCES = 'refs'
 
 # Here we map the data record property names onto ones in our entry format.
 # If a record property doesn't appear here it means the name says the same
-KEY_MAP = bidict({
+KEY_MAP = {
     mincepy.records.OBJ_ID: OBJ_ID,
     mincepy.records.TYPE_ID: TYPE_ID,
     mincepy.records.CREATION_TIME: CREATION_TIME,
@@ -35,10 +34,17 @@ KEY_MAP = bidict({
     mincepy.records.SNAPSHOT_HASH: SNAPSHOT_HASH,
     mincepy.records.SNAPSHOT_TIME: SNAPSHOT_TIME,
     mincepy.records.EXTRAS: EXTRAS,
-})
+}
+# The document key -> record property name mapping, the mappings are fixed so build this just once
+INVERSE_KEY_MAP = {value: key for key, value in KEY_MAP.items()}
 
 # endregion
 
+# The document keys of the DataRecord fields, in field order
+_RECORD_DB_KEYS = tuple(KEY_MAP[field] for field in mincepy.DataRecord._fields)
+# (record key, document key) pairs, resolved once rather than on every conversion
+_RECORD_KEY_PAIRS = tuple(zip(mincepy.DataRecord._fields, _RECORD_DB_KEYS))
+
 
 def to_record(entry) -> mincepy.DataRecord:
     """Convert a MongoDB data collection entry to a DataRecord"""
@@ -50,7 +56,7 @@ def to_record(entry) -> mincepy.DataRecord:
     # Invert our mapping of keys back to the data record property names and update over any
     # defaults
     record_dict.update(
-        {recordkey: entry[dbkey] for recordkey, dbkey in KEY_MAP.items() if dbkey in entry})
+        {recordkey: entry[dbkey] for recordkey, dbkey in _RECORD_KEY_PAIRS if dbkey in entry})
 
     return mincepy.DataRecord(**record_dict)
 
@@ -65,13 +71,14 @@ def to_document(record, exclude_defaults=False) -> dict:
 @to_document.register(mincepy.DataRecord)
 def _(record: mincepy.DataRecord, exclude_defaults=False) -> dict:
     """Convert a DataRecord to a MongoDB document with our keys"""
-    defaults = mincepy.DataRecord.defaults()
-    entry = {}
-    for key, item in record.__dict__.items():
-        db_key = KEY_MAP[key]  # pylint: disable=unsubscriptable-object
-        # Exclude entries that have the default value
-        if not (exclude_defaults and key in defaults and defaults[key] == item):
-            entry[db_key] = item
+    # Records are tuples so go through the fields by position rather than building a dictionary
+    entry = dict(zip(_RECORD_DB_KEYS, record))
+    if exclude_defaults:
+        for key, default in mincepy.DataRecord.defaults().items():
+            db_key = KEY_MAP[key]
+            # Exclude entries that have the default value
+            if entry[db_key] == default:
+                del entry[db_key]
 
     return entry
 
@@ -82,7 +89,7 @@ def _(record: dict, exclude_defaults=False) -> dict:
     defaults = mincepy.DataRecord.defaults()
     entry = {}
     for key, item in record.items():
-        db_key = KEY_MAP[key]  # pylint: disable=unsubscriptable-object
+        db_key = KEY_MAP[key]
         # Exclude entries that have the default value
         if not (exclude_defaults and key in defaults and defaults[key] == item):
             entry[db_key] = item
@@ -100,19 +107,16 @@ def remap(record_dict: dict) -> dict:
 
 def remap_back(entry_dict: dict) -> dict:
     remapped = {}
-    inverse_map = KEY_MAP.inverse
     for key, value in entry_dict.items():
-        if key in inverse_map:
-            remapped[inverse_map[key]] = value
+        if key in INVERSE_KEY_MAP:
+            remapped[INVERSE_KEY_MAP[key]] = value
     return remapped
 
 
 def remap_key(key: str) -> str:
     """Given a key remap it to the names that we use, even if it as a path e.g. state.colour"""
-    split_key = key.split('.')
-    base = KEY_MAP[split_key[0]]  # pylint: disable=unsubscriptable-object
-    split_key[0] = base
-    return '.'.join(split_key)
+    base, sep, rest = key.partition('.')
+    return KEY_MAP[base] + sep + rest
 
 
 def to_id_dict(sid: mincepy.SnapshotId) -> dict:
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import Optional, Sequence, Union, Iterable, Mapping, Iterator, Dict, Tuple
+from typing import Optional, Sequence, Union, Iterable, Mapping, Iterator, Dict, Tuple, List
 import weakref
 import uuid
 
@@ -163,18 +163,40 @@ class MongoArchive(mincepy.BaseArchive[bson.ObjectId]):
         if not isinstance(snapshot_id, mincepy.SnapshotId):
             raise TypeError(snapshot_id)
 
-        results = tuple(
-            self._history_collection.find({
-                db.OBJ_ID: snapshot_id.obj_id,
-                db.VERSION: snapshot_id.version
-            }))
-        if not results:
+        # The history collection is keyed by the string form of the snapshot id
+        result = self._history_collection.find_one({'_id': str(snapshot_id)})  # DB HIT
+        if result is None:
             raise mincepy.NotFound(f"Snapshot id '{snapshot_id}' not found")
-        return db.to_record(results[0])
+        return db.to_record(result)
+
+    def load_many(self, snapshot_ids: Sequence[mincepy.SnapshotId]) -> List[mincepy.DataRecord]:
+        for snapshot_id in snapshot_ids:
+            if not isinstance(snapshot_id, mincepy.SnapshotId):
+                raise TypeError(snapshot_id)
+
+        if not snapshot_ids:
+            return []
+
+        # The history collection is keyed by the string form of the snapshot id
+        sid_strings = [str(snapshot_id) for snapshot_id in snapshot_ids]
+        found = {
+            entry['_id']: entry
+            for entry in self._history_collection.find({'_id': q.in_(*sid_strings)})
+        }  # DB HIT
+
+        records = []
+        for snapshot_id, sid_string in zip(snapshot_ids, sid_strings):
+            try:
+                records.append(db.to_record(found[sid_string]))
+            except KeyError:
+                raise mincepy.NotFound(f"Snapshot id '{snapshot_id}' not found") from None
+        return records
 
     def get_snapshot_ids(self, obj_id: bson.ObjectId):
+        # Leave out the _id so this can be served entirely from the (obj_id, version) index
         results = self._history_collection.find({db.OBJ_ID: obj_id},
                                                 projection={
+                                                    '_id': 0,
                                                     db.OBJ_ID: 1,
                                                     db.VERSION: 1
                                                 },
@@ -190,11 +212,8 @@ class MongoArchive(mincepy.BaseArchive[bson.ObjectId]):
         # Single obj id
         if not isinstance(obj_id, bson.ObjectId):
             raise TypeError(f'Must pass an ObjectId, got {obj_id}')
-        found = self._meta_collection.find_one({'_id': obj_id})
-        if found is None:
-            return found
-        found.pop('_id')
-        return found
+        # The metadata is the whole document so just leave out the id
+        return self._meta_collection.find_one({'_id': obj_id}, projection={'_id': False})
 
     def meta_get_many(self, obj_ids: Iterable[bson.ObjectId]) -> Dict[bson.ObjectId, dict]:
         # Find multiple
@@ -66,7 +66,13 @@ try:
 
     @pytest.fixture
     def archive_uri() -> str:
-        return os.environ.get(ENV_ARCHIVE_URI, DEFAULT_ARCHIVE_URI)
+        uri = os.environ.get(ENV_ARCHIVE_URI, DEFAULT_ARCHIVE_URI)
+        # When running in parallel with pytest-xdist give each worker its own database
+        worker = os.environ.get('PYTEST_XDIST_WORKER')
+        if worker:
+            base, sep, options = uri.partition('?')
+            uri = f'{base}-{worker}{sep}{options}'
+        return uri
 
     @pytest.fixture
     def archive_base_uri() -> str:
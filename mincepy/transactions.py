@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 import contextlib
 import copy
-from typing import MutableMapping, Any, List, Sequence, Optional, Dict, Set, Union, overload
+import functools
+from typing import Any, List, Sequence, Optional, Dict, Set, Tuple, Union, overload
 import weakref
 
 import deprecation
@@ -10,7 +11,6 @@ from . import archives
 from . import exceptions
 from . import operations
 from . import records
-from . import utils
 from . import version as version_mod
 
 
@@ -18,29 +18,41 @@ class LiveObjects:
     """A container for storing live objects"""
 
     def __init__(self):
-        # Live object -> data records
-        self._records = \
-            utils.WeakObjectIdDict()  # type: MutableMapping[object, archives.DataRecord]
-        # Obj id -> (weak) object
-        self._objects = weakref.WeakValueDictionary()  # type: MutableMapping[Any, object]
+        # id(live object) -> (weak reference to the object, data record).  The single weak
+        # reference is used to clean up both this and the object id index when the object dies.
+        self._entries = {}  # type: Dict[int, Tuple[weakref.ReferenceType, archives.DataRecord]]
+        # Obj id -> weak reference to the live object
+        self._objects = {}  # type: Dict[Any, weakref.ReferenceType]
 
     def __str__(self):
         return '{} live'.format(len(self._objects))
 
     def __contains__(self, item: object):
         """Determine if an object instance is in this live objects container"""
-        return item in self._records
+        return id(item) in self._entries
 
     def insert(self, obj: object, record: records.DataRecord):
-        self._records[obj] = record
-        self._objects[record.obj_id] = obj
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is obj and entry[1].obj_id == record.obj_id:
+            # Already live, so just keep the weak reference we have
+            wref = entry[0]
+        else:
+            if entry is not None:
+                self._drop_obj_id(entry[1].obj_id, entry[0])
+            wref = weakref.ref(obj, functools.partial(self._finalised, key, record.obj_id))
+
+        self._entries[key] = wref, record
+        self._objects[record.obj_id] = wref
 
     def update(self, live_objects: 'LiveObjects'):
         """Like a dictionary update, take the given live objects container and absorb it into
         ourselves overwriting any existing values and incorporating any new"""
         # pylint: disable=protected-access
-        self._records.update(live_objects._records)
-        self._objects.update(live_objects._objects)
+        for wref, record in tuple(live_objects._entries.values()):
+            obj = wref()
+            if obj is not None:
+                self.insert(obj, record)
 
     def remove(self, obj_id) -> object:
         """Remove an object from the collection.  Returns the removed object.
@@ -48,13 +60,14 @@ class LiveObjects:
         :raises: :class:`mincepy.NotFound` if the ID is not found
         """
         try:
-            return self._records.pop(self._objects.pop(obj_id))
+            wref = self._objects.pop(obj_id)
+            return self._entries.pop(id(wref()))[1]
         except KeyError:
             raise exceptions.NotFound(obj_id) from None
 
     def get_record(self, obj: object) -> records.DataRecord:
         try:
-            return self._records[obj]
+            return self._entries[id(obj)][1]
         except KeyError:
             raise exceptions.NotFound(f"No live object found '{obj}'") from None
 
@@ -72,24 +85,40 @@ class LiveObjects:
         :raises: :class:`mincepy.NotFound` if the ID is not found
         """
         if isinstance(identifier, records.SnapshotId):
-            for obj, record in self._records.items():
-                if record.snapshot_id == identifier:
-                    return obj
+            # Find the object by its id and then check that it is at the requested snapshot
+            wref = self._objects.get(identifier.obj_id)
+            obj = wref() if wref is not None else None
+            if obj is not None and self._entries[id(obj)][1].snapshot_id == identifier:
+                return obj
             raise exceptions.NotFound(identifier)
 
         # Must be an object id
         try:
-            return self._objects[identifier]
+            obj = self._objects[identifier]()
         except KeyError:
-            raise exceptions.NotFound(f"No live object with id '{identifier}'") from None
+            obj = None
+        if obj is None:
+            raise exceptions.NotFound(f"No live object with id '{identifier}'")
+        return obj
 
     def get_snapshot_id(self, obj) -> records.SnapshotId:
         """Given an object, get the snapshot id"""
         try:
-            return self._records[obj].snapshot_id
+            return self._entries[id(obj)][1].snapshot_id
         except KeyError:
             raise exceptions.NotFound(obj) from None
 
+    def _finalised(self, key: int, obj_id, wref: weakref.ReferenceType):
+        """Called when a live object dies, removes all the entries for it"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is wref:
+            del self._entries[key]
+        self._drop_obj_id(obj_id, wref)
+
+    def _drop_obj_id(self, obj_id, wref: weakref.ReferenceType):
+        if self._objects.get(obj_id) is wref:
+            del self._objects[obj_id]
+
 
 class RollbackTransaction(Exception):
     pass
@@ -136,6 +165,9 @@ class Transaction:
         self._live_objects = LiveObjects()
         # Snapshot id -> obj for objects currently being saved
         self._in_progress_cache = {}  # type: Dict[records.SnapshotId, object]
+        # The reverse of the above: id(obj) -> snapshot id.  The cache holds a strong reference to
+        # each object so their ids can't be reused while they are in here.
+        self._in_progress_ids = {}  # type: Dict[int, records.SnapshotId]
 
         # Snapshots: snapshot id -> obj
         self._snapshots = {}  # type: Dict[records.SnapshotId, Any]
@@ -181,6 +213,7 @@ class Transaction:
     def prepare_for_saving(self, snapshot_id: records.SnapshotId, obj):
         """Insert a snapshot reference for an object into the transaction"""
         self._in_progress_cache[snapshot_id] = obj
+        self._in_progress_ids[id(obj)] = snapshot_id
         try:
             yield
         except Exception:  # Need this for the 'else' pylint: disable=try-except-raise
@@ -192,6 +225,7 @@ class Transaction:
                     'the snapshot id saved does not match that given'.format(snapshot_id))
         finally:
             del self._in_progress_cache[snapshot_id]
+            del self._in_progress_ids[id(obj)]
 
     @overload
     def get_live_object(self, identifier: records.SnapshotId) -> object:
@@ -217,11 +251,10 @@ class Transaction:
         return self._live_objects.get_record(obj)
 
     def get_snapshot_id_for_live_object(self, obj) -> records.SnapshotId:
-        for snapshot_id, cached_obj in self._in_progress_cache.items():
-            if obj is cached_obj:
-                return snapshot_id
-
-        return self._live_objects.get_snapshot_id(obj)
+        try:
+            return self._in_progress_ids[id(obj)]
+        except KeyError:
+            return self._live_objects.get_snapshot_id(obj)
 
     def delete(self, obj_id):
         """Mark an object as deleted"""
@@ -295,6 +328,7 @@ class Transaction:
         self._live_objects.update(transaction.live_objects)
         self._snapshots.update(transaction.snapshots)
         self._in_progress_cache.update(transaction._in_progress_cache)
+        self._in_progress_ids.update(transaction._in_progress_ids)
         self._staged.extend(transaction.staged)
         self._metas.update(transaction.metas)
         for deleted in transaction.deleted:
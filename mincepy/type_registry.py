@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import collections
 from typing import Type, MutableMapping, Any, Union
+import weakref
 
 from . import helpers
 from . import types
@@ -15,6 +16,11 @@ class TypeRegistry:
     def __init__(self):
         self._helpers = {}  # type: MutableMapping[SavableObjectType, helpers.TypeHelper]
         self._type_ids = {}  # type: MutableMapping[Any, SavableObjectType]
+        # Caches (type -> helper, type -> type id) of the issubclass lookups for types that aren't
+        # registered directly.  These are reset whenever a new helper is inserted and hold the types
+        # weakly so that dynamically created classes aren't kept alive.
+        self._subclass_helpers = weakref.WeakKeyDictionary()
+        self._subclass_type_ids = weakref.WeakKeyDictionary()
 
     def __contains__(self, item: SavableObjectType) -> bool:
         return item in self._helpers
@@ -45,10 +51,16 @@ class TypeRegistry:
         try:
             # Try a direct lookup first
             return self._helpers[obj_type].TYPE_ID
+        except KeyError:
+            pass
+
+        try:
+            return self._subclass_type_ids[obj_type]
         except KeyError:
             # Try an issubclass lookup as a backup
             for type_id, known_type in self._type_ids.items():
                 if issubclass(obj_type, known_type):
+                    self._subclass_type_ids[obj_type] = type_id
                     return type_id
 
         raise ValueError(f"Type '{obj_type}' is not known")
@@ -69,10 +81,16 @@ class TypeRegistry:
         try:
             # Try the direct lookup
             return self._helpers[obj_type]
+        except KeyError:
+            pass
+
+        try:
+            return self._subclass_helpers[obj_type]
         except KeyError:
             # Do the full issubclass lookup
             for known_type, helper in self._helpers.items():
                 if issubclass(obj_type, known_type):
+                    self._subclass_helpers[obj_type] = helper
                     return helper
             raise ValueError(f"Type '{obj_type}' has not been registered") from None
 
@@ -125,3 +143,7 @@ class TypeRegistry:
         for obj_type in obj_types:
             self._helpers[obj_type] = helper
             self._type_ids[helper.TYPE_ID] = obj_type
+
+        # The new types may change the outcome of subclass lookups
+        self._subclass_helpers.clear()
+        self._subclass_type_ids.clear()
@@ -3,6 +3,7 @@ from abc import ABCMeta, abstractmethod
 import datetime
 from typing import Type, List
 import uuid
+import weakref
 
 try:  # Python3
     from hashlib import blake2b
@@ -88,6 +89,8 @@ class SavableObject(Object, Savable, metaclass=ABCMeta):
 
     def __eq__(self, other) -> bool:
         """Determine if two objects are equal"""
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
 
@@ -102,6 +105,10 @@ class Equator:
 
     def __init__(self, equators=tuple()):
         self._equators = list(equators)
+        # Cache of type -> equator (or None if there isn't one) to avoid scanning all equators.
+        # Lookups are by type(obj) so an ABC virtual subclass registered after its type has been
+        # looked up won't be picked up until the cache is cleared by adding or removing an equator.
+        self._type_equators = weakref.WeakKeyDictionary()
 
         def do_hash(*args):
             hasher = blake2b(digest_size=32)
@@ -114,6 +121,7 @@ class Equator:
 
     def add_equator(self, equator):
         self._equators.append(equator)
+        self._type_equators.clear()
 
     def remove_equator(self, equator):
         self._equators.reverse()
@@ -123,14 +131,27 @@ class Equator:
             raise ValueError(f"Unknown equator '{equator}'") from exc
         finally:
             self._equators.reverse()
+            self._type_equators.clear()
 
     def get_equator(self, obj):
+        obj_type = type(obj)
+        try:
+            equator = self._type_equators[obj_type]
+        except KeyError:
+            equator = self._type_equators[obj_type] = self._find_equator(obj)
+
+        if equator is None:
+            raise TypeError("Don't know how to compare '{}' types, no type equator set".format(
+                type(obj)))
+
+        return equator
+
+    def _find_equator(self, obj):
         # Iterate in reversed order i.e. the latest added should be used preferentially
         for equator in reversed(self._equators):
             if isinstance(obj, equator.TYPE):
                 return equator
-        raise TypeError("Don't know how to compare '{}' types, no type equator set".format(
-            type(obj)))
+        return None
 
     def yield_hashables(self, obj):
         try:
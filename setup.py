@@ -30,7 +30,6 @@ setup(
         'deprecation',
         'dnspython',  # Needed to be able to connect using domain name rather than IP
         'pymongo<4.0',
-        'bidict',
         'networkx',  # For reference graphs
         'pyblake2; python_version<"3.6"',
         'pytray>=0.2.1',
@@ -49,6 +48,7 @@ setup(
             'pytest>4',
             'pytest-benchmark',
             'pytest-cov',
+            'pytest-xdist',
             'pre-commit',
             'prospector',
             'pylint',
@@ -1,15 +1,45 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=unused-import, redefined-outer-name
+import os
 import random
 
+import pymongo
+import pymongo.uri_parser
 import pytest
 
 import mincepy
 from mincepy import testing
-from mincepy.testing import archive_uri, mongodb_archive, historian, archive_base_uri
+from mincepy.testing import archive_uri, historian, archive_base_uri
 from . import utils
 
 
+@pytest.fixture(scope='session')
+def mongo_client():
+    """A MongoDB client shared by the whole test session so tests don't each open a connection"""
+    uri = os.environ.get(testing.ENV_ARCHIVE_URI, testing.DEFAULT_ARCHIVE_URI)
+    client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=30000)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def mongodb_archive(archive_uri, request):
+    if archive_uri.startswith('mongomock'):
+        with testing.temporary_archive(archive_uri) as mongo_archive:
+            yield mongo_archive
+        return
+
+    db_name = pymongo.uri_parser.parse_uri(archive_uri).get('database', None)
+    if not db_name:
+        raise ValueError(f'Failed to supply database on MongoDB uri: {archive_uri}')
+
+    # Only connect to a real server when the tests actually use one
+    mongo_client = request.getfixturevalue('mongo_client')
+    database = mongo_client[db_name]
+    yield mincepy.mongo.MongoArchive(database)
+    mongo_client.drop_database(database)
+
+
 @pytest.fixture
 def standard_dataset(historian: mincepy.Historian):
     with historian.transaction():
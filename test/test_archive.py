@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from typing import Sequence
 
+import pytest
+
 import mincepy
 from mincepy.testing import Car
 
@@ -126,3 +128,33 @@ def test_archive_listener(mongodb_archive: mincepy.Archive):
     for oper, record in zip(listener.bulk_write[0][1], records):
         assert isinstance(oper, mincepy.operations.Insert)
         assert oper.record == record
+
+
+def test_load_many(historian: mincepy.Historian):
+    car1 = Car('honda', 'white')
+    car2 = Car('ferrari', 'red')
+    historian.save(car1, car2)
+    sid1 = historian.get_snapshot_id(car1)
+    car1.colour = 'black'
+    historian.save(car1)
+    sid2 = historian.get_snapshot_id(car2)
+    sid3 = historian.get_snapshot_id(car1)
+
+    records = historian.archive.load_many((sid3, sid1, sid2))
+    assert [record.snapshot_id for record in records] == [sid3, sid1, sid2]
+    assert records[0].state['colour'] == 'black'
+    assert records[1].state['colour'] == 'white'
+    assert historian.archive.load_many(()) == []
+
+    with pytest.raises(mincepy.NotFound):
+        historian.archive.load_many((sid1, mincepy.SnapshotId(sid1.obj_id, 10)))
+
+    # Now check loading snapshots through the historian
+    white, red = historian.load(sid1, sid2)
+    assert white.colour == 'white'
+    assert red.colour == 'red'
+
+    # Each snapshot should be loaded independently, just as when loading them one at a time
+    white1, white2 = historian.load(sid1, sid1)
+    assert white1 is not white2
+    assert white1.colour == white2.colour == 'white'
@@ -65,6 +65,14 @@ def test_expr_and_or():
     assert (ored | ored).operand == [name_eq, age_gt, name_eq, age_gt]
     assert (ored & ored).operand != [name_eq, age_gt, name_eq, age_gt]
 
+    # Test that chaining stays flat
+    chained = name_eq
+    for _ in range(3):
+        chained &= age_gt
+    assert chained.operand == [name_eq, age_gt, age_gt, age_gt]
+    assert (name_eq & anded).operand == [name_eq, name_eq, age_gt]
+    assert (name_eq | ored).operand == [name_eq, name_eq, age_gt]
+
 
 def test_build_expr():
     """Test building an expression from a query dictionary"""
@@ -75,6 +83,16 @@ def test_build_expr():
 
     assert isinstance(expr.build_expr({'name': 'tom', 'age': 54}), expr.And)
 
+    # All the simple operators should be known, including the element ones
+    assert set(expr.COMPARISON_OPERATORS) == {
+        '$eq', '$gt', '$gte', '$in', '$lt', '$lte', '$ne', '$nin', '$exists'
+    }
+    exists = expr.build_expr({'name': {'$exists': True}})
+    assert isinstance(exists.expr, expr.Exists)
+
+    with pytest.raises(TypeError):
+        expr.build_expr(5)
+
 
 def test_query_overlapping_filter_keys():
     gt_24 = expr.Comparison('age', expr.Gt(24))
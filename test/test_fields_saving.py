@@ -188,6 +188,22 @@ def test_nested_fields():
            {'$and': [{'tag': 'holiday'}, {'thumbnail.width': 64}]}
 
 
+def test_field_path_prefix():
+    """Check that the (cached) path follows changes to the path prefix"""
+    a_field = fields.field('colour')
+    assert a_field.get_path() == 'colour'
+    a_field.path_prefix = 'state'
+    assert a_field.get_path() == 'state.colour'
+    assert expr.query_expr(a_field == 'red') == {'state.colour': 'red'}
+
+    # An empty context shouldn't add anything and an 'and' context should be kept flat
+    a_field.set_query_context(expr.Empty())
+    assert expr.query_expr(a_field == 'red') == {'state.colour': 'red'}
+    a_field.set_query_context((fields.field('tag') == 'car') & (fields.field('wheels') == 4))
+    assert expr.query_expr(a_field == 'red') == \
+           {'$and': [{'tag': 'car'}, {'wheels': 4}, {'state.colour': 'red'}]}
+
+
 class Animal(fields.WithFields):
 
     def __init__(self):
@@ -120,3 +120,43 @@ def test_file_eq(historian: mincepy.Historian):
     assert file1 == file1_again
     assert file1 != file3
     assert file1_again != file3
+
+
+def test_file_eq_binary(historian: mincepy.Historian, monkeypatch):
+    """Check that binary contents spanning multiple read blocks are compared correctly"""
+    monkeypatch.setattr(mincepy.File, 'READ_SIZE', 4)
+    data = b'\x00\n\x01\x02\n\n\x03' * 10
+
+    file1 = historian.create_file('file1')
+    file1_again = historian.create_file('file1')
+    file1_differs = historian.create_file('file1')
+    file1_longer = historian.create_file('file1')
+    with file1.open('wb') as stream:
+        stream.write(data)
+    with file1_again.open('wb') as stream:
+        stream.write(data)
+    with file1_differs.open('wb') as stream:
+        stream.write(data[:-1] + b'\x04')
+    with file1_longer.open('wb') as stream:
+        stream.write(data + b'\x00')
+
+    assert file1 == file1_again
+    assert file1 != file1_differs
+    assert file1 != file1_longer
+    assert historian.hash(file1) == historian.hash(file1_again)
+    assert historian.hash(file1) != historian.hash(file1_differs)
+
+
+def test_file_eq_encoding(historian: mincepy.Historian):
+    """Files are compared by their raw bytes, so the same text stored with different encodings is
+    not equal (consistent with their hashes)"""
+    latin = historian.create_file('file', encoding='latin-1')
+    utf8 = historian.create_file('file', encoding='utf-8')
+    with latin.open('w') as stream:
+        stream.write('caf\u00e9')
+    with utf8.open('w') as stream:
+        stream.write('caf\u00e9')
+
+    assert latin.read_text() == utf8.read_text()
+    assert latin != utf8
+    assert historian.hash(latin) != historian.hash(utf8)
@@ -52,3 +52,13 @@ def test_distinct(historian):
     # Now using the field
     assert set(historian.objects.distinct(testing.Car.colour)) == {'green', 'black', 'red', 'green'}
     assert len(list(historian.objects.distinct(mincepy.DataRecord.obj_id))) == 5
+
+
+def test_any(historian):
+    assert historian.find(testing.Car).any() is None
+
+    car = testing.Car('ferrari', 'red')
+    car.save()
+    testing.Car('honda', 'white').save()
+    assert isinstance(historian.find(testing.Car).any(), testing.Car)
+    assert historian.find(testing.Car.make == 'ferrari').any() is car
@@ -164,6 +164,25 @@ def test_save(historian: mincepy.Historian):
         historian.save((car, {'speed': 'fast'}, 124))
 
 
+def test_load_many(historian: mincepy.Historian):
+    ferrari = Car('ferrari', 'red')
+    honda = Car('honda', 'white')
+    ferrari_id, honda_id = historian.save(ferrari, honda)
+    ferrari_sid = historian.get_snapshot_id(ferrari)
+    del honda
+
+    # A mix of a live object, one that needs to be loaded, repeats and a snapshot
+    loaded = historian.load(ferrari_id, honda_id, honda_id, ferrari_sid)
+    assert loaded[0] is ferrari
+    assert loaded[1].make == 'honda'
+    assert loaded[2] is loaded[1]
+    assert loaded[3] is not ferrari
+    assert loaded[3].make == 'ferrari'
+
+    with pytest.raises(mincepy.NotFound):
+        historian.load(ferrari_id, historian.archive.create_archive_id())
+
+
 def test_is_trackable(historian: mincepy.Historian):
     assert historian.is_trackable(mincepy.testing.Car) is True
     assert historian.is_trackable(5) is False
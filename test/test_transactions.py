@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """Module for testing saved snapshots"""
+import pytest
 
 import mincepy
 from mincepy import testing
+from mincepy import transactions
 
 
 def test_snapshot_id_in_transaction(historian: mincepy.Historian):
@@ -16,3 +18,46 @@ def test_snapshot_id_in_transaction(historian: mincepy.Historian):
         car.make = 'honda'
         car.save()
         assert historian.get_snapshot_id(car) != sid
+
+
+def test_live_objects_get_object(historian: mincepy.Historian):
+    """Check that live objects can be looked up by object and snapshot id"""
+    car = testing.Car('ferrari', 'red')
+    car.save()
+    old_sid = historian.get_snapshot_id(car)
+    car.colour = 'black'
+    car.save()
+    sid = historian.get_snapshot_id(car)
+
+    live_objects = transactions.LiveObjects()
+    live_objects.insert(car, historian.get_current_record(car))
+    assert live_objects.get_object(car.obj_id) is car
+    assert live_objects.get_object(sid) is car
+
+    # Only the current snapshot is live
+    with pytest.raises(mincepy.NotFound):
+        live_objects.get_object(old_sid)
+    with pytest.raises(mincepy.NotFound):
+        live_objects.get_object(mincepy.SnapshotId(historian.archive.create_archive_id(), 0))
+
+
+def test_live_objects_finalised(historian: mincepy.Historian):
+    """Check that live objects are removed from all the indexes once they die"""
+    car = testing.Car('ferrari', 'red')
+    car_id = car.save()
+    record = historian.get_current_record(car)
+
+    live_objects = transactions.LiveObjects()
+    live_objects.insert(car, record)
+    updated = transactions.LiveObjects()
+    updated.update(live_objects)
+    assert car in updated
+    assert updated.get_record(car) is record
+
+    del car
+    for container in (live_objects, updated):
+        with pytest.raises(mincepy.NotFound):
+            container.get_object(car_id)
+        with pytest.raises(mincepy.NotFound):
+            container.get_object(record.snapshot_id)
+        assert str(container) == '0 live'
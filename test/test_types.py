@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
-import mincepy
+from hashlib import blake2b
+import uuid
+
+import pytest
 
+import mincepy
+from mincepy import defaults, type_registry, types
 from mincepy.testing import Car
 
 
@@ -27,3 +32,47 @@ def test_savable_object(historian: mincepy.Historian):
 
     reloaded = historian.load(car_id)
     assert reloaded.make == 'honda'
+
+
+def test_registry_subclass_lookup():
+    """Check that unregistered subclasses resolve to the helper of their registered ancestor, and
+    that registering the subclass takes over from that"""
+
+    class SportsCar(Car):
+        TYPE_ID = uuid.UUID('3f6c1d0e-63b8-4a5e-9c45-2a4b6d0bb3e9')
+
+    registry = type_registry.TypeRegistry()
+    registry.register_type(Car)
+    assert registry.get_helper(SportsCar).TYPE is Car
+    assert registry.get_type_id(SportsCar) == Car.TYPE_ID
+
+    registry.register_type(SportsCar)
+    assert registry.get_helper(SportsCar).TYPE is SportsCar
+    assert registry.get_type_id(SportsCar) == SportsCar.TYPE_ID
+
+
+def test_equator_type_cache():
+    equator = types.Equator(defaults.get_default_equators())
+    assert equator.hash([1, 'a']) == equator.hash([1, 'a'])
+    assert equator.eq({'a': 1}, {'a': 1})
+    with pytest.raises(TypeError):
+        equator.get_equator(object())
+
+    # Adding an equator should invalidate the cached lookups
+    class ObjectEquator(mincepy.comparators.SimpleHelper):
+        TYPE = object
+
+        def yield_hashables(self, obj, hasher):
+            yield b'object'
+
+    equator.add_equator(ObjectEquator())
+    assert isinstance(equator.get_equator(object()), ObjectEquator)
+
+
+def test_equator_leaf_hashes():
+    """Numbers and None are hashed via their string representation"""
+    equator = types.Equator(defaults.get_default_equators())
+    assert equator.hash(5) == equator.hash('5') == blake2b(b'5', digest_size=32).hexdigest()
+    assert equator.hash(1.5) == equator.hash('1.5')
+    assert equator.hash(None) == equator.hash('None')
+    assert equator.hash([1, None]) == equator.hash(['1', 'None'])